@@ -36,6 +36,11 @@ class LoggerClass {
   // checks if the logging is active
   virtual bool isLogging() { return log_stream_ptr != nullptr; }
 
+  // checks if messages with the indicated level are logged
+  bool isLogging(DlnaLogLevel level) {
+    return isLogging() && level >= log_level;
+  }
+
   /// Print log message
   void log(DlnaLogLevel current_level, const char* fmt...) {
     if (current_level >= log_level && log_stream_ptr != nullptr &&
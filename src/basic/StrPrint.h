@@ -20,6 +20,10 @@ class StrPrint : public Print {
   }
 
   size_t write(const uint8_t* buffer, size_t size) override {
+    // grow at most once for the whole buffer
+    if (str.length() + size >= str.capacity() - 1) {
+      str.setCapacity(str.length() + size + inc_size);
+    }
     size_t result = 0;
     for (int j = 0; j < size; j++) {
       result += write(buffer[j]);
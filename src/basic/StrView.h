@@ -274,14 +274,12 @@ class StrView {
   /// start position
   virtual int indexOf(const char* cont, int start = 0) {
     if (chars == nullptr || cont == nullptr) return -1;
-    int contLen = strlen(cont);
-    for (int j = start; j < len; j++) {
-      char* pt = chars + j;
-      if (strncmp(pt, cont, contLen) == 0) {
-        return j;
-      }
-    }
-    return -1;
+    if (start < 0) start = 0;
+    if (start >= len) return -1;
+    // use the optimized search of the C library
+    const char* pt = strstr(chars + start, cont);
+    if (pt == nullptr || pt - chars >= len) return -1;
+    return pt - chars;
   }
 
   /// provides the position of the last occurrence of the indicated substring
@@ -661,25 +659,18 @@ class StrView {
 
   /// Returns true if the string is an integer
   bool isInteger() {
-    bool result = containsNumber();
+    bool has_digit = false;
     int minus_count = 0;
+    // single pass which stops at the first invalid character
     for (int j = 0; j < len; j++) {
       char c = chars[j];
-      if (!isdigit(c)) {
-        switch (c) {
-          case '-':
-            minus_count++;
-            if (minus_count > 1) {
-              result = false;
-            }
-            break;
-          default:
-            result = false;
-            break;
-        }
+      if (isdigit(c)) {
+        has_digit = true;
+      } else if (c != '-' || ++minus_count > 1) {
+        return false;
       }
     }
-    return result;
+    return has_digit;
   }
 
   /// Determines the number of decimals in the number string
@@ -700,32 +691,23 @@ class StrView {
 
   // Returns true if the string is a number
   bool isNumber() {
-    bool result = containsNumber();
+    bool has_digit = false;
     int dot_count = 0;
     int minus_count = 0;
+    // single pass which stops at the first invalid character
     for (int j = 0; j < len; j++) {
       char c = chars[j];
-      if (!isdigit(c)) {
-        switch (c) {
-          case '-':
-            minus_count++;
-            if (minus_count > 1) {
-              result = false;
-            }
-            break;
-          case '.':
-            dot_count++;
-            if (dot_count > 1) {
-              result = false;
-            }
-            break;
-          default:
-            result = false;
-            break;
-        }
+      if (isdigit(c)) {
+        has_digit = true;
+      } else if (c == '-') {
+        if (++minus_count > 1) return false;
+      } else if (c == '.') {
+        if (++dot_count > 1) return false;
+      } else {
+        return false;
       }
     }
-    return result;
+    return has_digit;
   }
 
   const char* buildPath(const char* start, const char* p1=nullptr, const char* p2=nullptr) {
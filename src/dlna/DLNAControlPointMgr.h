@@ -2,7 +2,6 @@
 
 #include "DLNAControlPointRequestParser.h"
 #include "DLNADevice.h"
-#include "DLNADeviceMgr.h"
 #include "Schedule.h"
 #include "Scheduler.h"
 #include "basic/StrPrint.h"
@@ -36,6 +35,8 @@ class DLNAControlPointMgr {
   void setParseDevice(bool flag) { is_parse_device = flag; }
   /// Defines the lacal url (needed for subscriptions)
   void setLocalURL(Url url) { local_url = url; }
+  /// Keep the http connection open between the posted actions (default true)
+  void setKeepAlive(bool flag) { is_keep_alive = flag; }
 
   /**
    * @brief start the processing by sending out a MSearch. For the search target
@@ -240,12 +241,7 @@ version: locate service of a given type
       return false;
     }
     // get xml
-    uint8_t buffer[512];
-    while (true) {
-      int len = req.read(buffer, 512);
-      if (len == 0) break;
-      xml.write(buffer, len);
-    }
+    readReply(req, xml);
     req.stop();
 
     // parse xml
@@ -272,6 +268,9 @@ version: locate service of a given type
   XMLPrinter xml;
   bool is_active = false;
   bool is_parse_device = false;
+  bool is_keep_alive = true;
+  Str last_host;
+  int last_port = 0;
   DLNADevice NO_DEVICE{false};
   const char* search_target;
   StringRegistry strings;
@@ -288,6 +287,8 @@ version: locate service of a given type
       bool select = selfDLNAControlPoint->matches(data.usn.c_str());
       DlnaLogger.log(DlnaInfo, "addDevice: %s -> %s", data.usn.c_str(),
                      select ? "added" : "filtered");
+      // only load and parse the device xml of relevant devices
+      if (!select) return true;
       Url url{data.location.c_str()};
       selfDLNAControlPoint->addDevice(url);
       return true;
@@ -346,11 +347,11 @@ version: locate service of a given type
 
     char ns[200];
     StrView namespace_str(ns, 200);
-    namespace_str = "xmlns:u=\"%1\"";
-    bool ok = namespace_str.replace("%1", action.getServiceType());
+    namespace_str = "xmlns:u=\"";
+    namespace_str.add(action.getServiceType());
+    namespace_str.add("\"");
     DlnaLogger.log(DlnaDebug, "ns = '%s'", namespace_str.c_str());
 
-    // assert(ok);
     result += xml.printNodeBegin(action.action, namespace_str.c_str(), "u");
     for (auto arg : action.arguments) {
       result += xml.printNode(arg.name, arg.value.c_str());
@@ -364,9 +365,14 @@ version: locate service of a given type
 
   ActionReply postAllActions() {
     ActionReply result;
+    // reuse the connection for all actions
+    const char* connection = p_http->getConnection();
+    p_http->setConnection(is_keep_alive ? CON_KEEP_ALIVE : CON_CLOSE);
     for (auto& action : actions) {
       if (action.getServiceType() != nullptr) result.add(postAction(action));
     }
+    p_http->stop();
+    p_http->setConnection(connection);
     return result;
   }
 
@@ -388,15 +394,32 @@ version: locate service of a given type
     action_str.add(action.action);
     action_str.add("\"");
 
-    p_http->request().put("SOAPACTION", action_str.c_str());
+    p_http->request().put(SOAPACTION, action_str.c_str());
 
     // crate control url
     char url_buffer[200] = {0};
     Url post_url{getUrl(device, service.control_url, url_buffer, 200)};
 
+    // a kept alive connection can only be reused for the same host and port
+    if (!isLastHost(post_url)) {
+      p_http->stop();
+      // the host header must follow the new host
+      if (!last_host.isEmpty()) p_http->setHost(nullptr);
+      last_host = post_url.host();
+      last_port = post_url.port();
+    }
+
     // post the request
+    bool is_reused = p_http->connected();
     int rc = p_http->post(post_url, "text/xml", str_print.c_str(),
                           str_print.length());
+    // the server might have closed the reused connection: retry once
+    if (is_reused && rc <= 0) {
+      DlnaLogger.log(DlnaInfo, "Retrying on a new connection");
+      p_http->stop();
+      rc = p_http->post(post_url, "text/xml", str_print.c_str(),
+                        str_print.length());
+    }
 
     // check result
     DlnaLogger.log(DlnaInfo, "==> http rc %d", rc);
@@ -409,21 +432,65 @@ version: locate service of a given type
     // log xml request
     DlnaLogger.log(DlnaDebug, str_print.c_str());
 
-    // receive result
+    // receive result: the connection can only be reused if the full content
+    // has been consumed. The content is only collected if it is logged
+    bool is_logging = DlnaLogger.isLogging(DlnaDebug);
     str_print.reset();
-    uint8_t buffer[200];
-    while (p_http->client()->available()) {
-      int len = p_http->client()->read(buffer, 200);
-      str_print.write(buffer, len);
-    }
+    bool is_complete = readReply(*p_http, str_print, is_logging);
+    bool is_closed = StrView(p_http->reply().get(CONNECTION))
+                         .equalsIgnoreCase(CON_CLOSE);
+    if (!is_keep_alive || !is_complete || is_closed) p_http->stop();
 
     // log result
-    DlnaLogger.log(DlnaDebug, str_print.c_str());
-    p_http->stop();
+    if (is_logging) DlnaLogger.log(DlnaDebug, str_print.c_str());
 
     return result;
   }
 
+  /// checks if the url is on the host and port of the last request
+  bool isLastHost(Url& url) {
+    if (last_host.isEmpty() || last_port != url.port()) return false;
+    return last_host.equals(url.host());
+  }
+
+  /// Reads the reply content of the request: returns false if the end of the
+  /// content could not be determined
+  bool readReply(HttpRequest& http, StrPrint& out, bool collect = true) {
+    bool is_chunked = http.reply().isChunked();
+    const char* len_str = http.reply().get(CONTENT_LENGTH);
+    // without length the content ends when the server closes the connection
+    bool is_open_end = !is_chunked && len_str == nullptr;
+    int open = StrView(len_str).toInt();
+    uint64_t timeout = http.client()->getTimeout();
+    uint64_t end = millis() + timeout;
+    uint8_t buffer[512];
+    while (true) {
+      bool is_available = http.client()->available() > 0;
+      if (is_chunked) {
+        if (http.available() <= 0) break;
+      } else if (is_open_end) {
+        if (!is_available && !http.connected()) break;
+      } else if (open <= 0) {
+        break;
+      }
+      if (!is_available) {
+        if (millis() > end) {
+          DlnaLogger.log(DlnaWarning, "Timeout reading the reply");
+          return false;
+        }
+        delay(5);
+        continue;
+      }
+      int max = is_open_end || is_chunked || open > 512 ? 512 : open;
+      int len = http.read(buffer, max);
+      if (len <= 0) continue;
+      if (collect) out.write(buffer, len);
+      open -= len;
+      end = millis() + timeout;
+    }
+    return !is_open_end;
+  }
+
   const char* getUrl(DLNADevice& device, const char* suffix, const char* buffer,
                      int len) {
     StrView url_str{(char*)buffer, len};
@@ -8,7 +8,6 @@
 #include "basic/Icon.h"
 #include "basic/Vector.h"
 #include "service/Action.h"
-#include "vector"
 #include "xml/XMLPrinter.h"
 
 namespace tiny_dlna {
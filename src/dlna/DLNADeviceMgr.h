@@ -1,6 +1,5 @@
 #pragma once
 
-#include "DLNADeviceMgr.h"
 #include "DLNADevice.h"
 #include "DLNADeviceRequestParser.h"
 #include "Schedule.h"
@@ -2,7 +2,6 @@
 
 #include "IUDPService.h"
 #include "Scheduler.h"
-#include "DLNAControlPointMgr.h"
 
 namespace tiny_dlna {
 
@@ -20,12 +19,12 @@ class DLNADeviceRequestParser {
   Schedule* parse(DLNADevice& device, RequestData& req) {
     p_device = &device;
     Schedule result;
-    if (req.data.contains("M-SEARCH")) {
+    if (req.data.startsWith("M-SEARCH")) {
       return processMSearch(req);
     }
 
     // We ignore alive notifications
-    if (req.data.contains("NOTIFY")) {
+    if (req.data.startsWith("NOTIFY")) {
       if (req.data.contains("ssdp:alive")) {
         DlnaLogger.log(DlnaDebug, "invalid request: %s", req.data.c_str());
       } else {
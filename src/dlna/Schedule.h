@@ -25,6 +25,9 @@ struct Schedule {
   // schedle is active
   bool active = false;
 
+  // subclasses are deleted via the Scheduler
+  virtual ~Schedule() = default;
+
   virtual bool process(IUDPService &udp) { return false; }
 
   virtual const char *name() { return "n/a"; };
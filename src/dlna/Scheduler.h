@@ -57,16 +57,17 @@ class Scheduler {
  protected:
   Vector<Schedule *> queue;
 
+  /// removes and deletes all inactive schedules
   void cleanup() {
-    for (auto it = queue.begin(); it != queue.end(); ++it) {
-      auto p_rule = *it;
+    // iterate backwards so that erase does not skip any entries
+    for (int j = queue.size() - 1; j >= 0; j--) {
+      auto p_rule = queue[j];
       if (!(p_rule)->active) {
         DlnaLogger.log(DlnaDebug, "cleanup queue: %s", p_rule->name());
         // remove schedule from collection
-        queue.erase(it);
+        queue.erase(j);
         // delete schedule
         delete p_rule;
-        break;
       }
     }
   }
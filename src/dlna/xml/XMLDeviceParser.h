@@ -24,6 +24,9 @@ class XMLDeviceParser {
     result.base_url = nullptr;
     result.device_url = empty_url;
     p_device = &result;
+    // the device fields are only searched from the device element onwards
+    device_pos = str.indexOf("<device>");
+    if (device_pos < 0) device_pos = 0;
     parseVersion(result);
     parseIcons(result);
     parseDevice(result);
@@ -33,6 +36,7 @@ class XMLDeviceParser {
   StrView str;
   DLNADevice* p_device = nullptr;
   StringRegistry* p_strings = nullptr;
+  int device_pos = 0;
 
   /// extract string, add to string repository and return repository string
   const char* substring(char* in, int pos, int end) {
@@ -49,14 +53,14 @@ class XMLDeviceParser {
   }
 
   void parseDevice(DLNADevice& result) {
-    parseStr("<deviceType>", result.device_type);
-    parseStr("<friendlyName>", result.friendly_name);
-    parseStr("<manufacturer>", result.manufacturer);
-    parseStr("<manufacturerURL>", result.manufacturer_url);
-    parseStr("<modelDescription>", result.model_description);
-    parseStr("<modelName>", result.model_name);
-    parseStr("<modelNumber>", result.model_number);
-    parseStr("<modelURL>", result.model_url);
+    parseStr(device_pos, "<deviceType>", result.device_type);
+    parseStr(device_pos, "<friendlyName>", result.friendly_name);
+    parseStr(device_pos, "<manufacturer>", result.manufacturer);
+    parseStr(device_pos, "<manufacturerURL>", result.manufacturer_url);
+    parseStr(device_pos, "<modelDescription>", result.model_description);
+    parseStr(device_pos, "<modelName>", result.model_name);
+    parseStr(device_pos, "<modelNumber>", result.model_number);
+    parseStr(device_pos, "<modelURL>", result.model_url);
     parseStr("<URLBase>", result.base_url);
     parseServices();
   };
@@ -71,8 +75,7 @@ class XMLDeviceParser {
     int start_pos = str.indexOf(name, pos);
     int end_pos = -1;
     if (start_pos > 0) {
-      StrView tag(name);
-      start_pos += tag.length();
+      start_pos += strlen(name);
       end_pos = str.indexOf("</", start_pos);
       temp_view.substring((char*)str.c_str(), start_pos, end_pos);
       result = temp_view.toInt();
@@ -87,8 +90,7 @@ class XMLDeviceParser {
     int start_pos = str.indexOf(name, pos);
     int end = -1;
     if (start_pos > 0) {
-      StrView tag(name);
-      start_pos += tag.length();
+      start_pos += strlen(name);
       int end_str = str.indexOf("</", start_pos);
       result = substring((char*)str.c_str(), start_pos, end_str);
       DlnaLogger.log(DlnaDebug, "device xml %s : %s", name, result);
@@ -100,7 +102,7 @@ class XMLDeviceParser {
   }
 
   void parseIcons(DLNADevice& device) {
-    int pos = 0;
+    int pos = device_pos;
     do {
       pos = parseIcon(device, pos);
     } while (pos > 0);
@@ -123,7 +125,7 @@ class XMLDeviceParser {
   }
 
   void parseServices() {
-    int pos = 0;
+    int pos = device_pos;
     do {
       pos = parseService(pos);
     } while (pos > 0);
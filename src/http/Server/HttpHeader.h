@@ -30,6 +30,7 @@ const char* HOST_C = "Host";
 const char* ACCEPT_ENCODING = "Accept-Encoding";
 const char* IDENTITY = "identity";
 const char* LOCATION = "Location";
+const char* SOAPACTION = "SOAPACTION";
 
 // Http methods
 enum TinyMethodID {
@@ -82,6 +83,7 @@ class HttpHeader {
 
   /// clears the data - usually we do not delete but we just set the active flag
   HttpHeader& clear(bool activeFlag = true) {
+    status_code = T_UNDEFINED;
     is_written = false;
     is_chunked = false;
     url_path = "/";
@@ -163,7 +165,6 @@ class HttpHeader {
   const char* get(const char* key) {
     for (auto it = lines.begin(); it != lines.end(); ++it) {
       HttpHeaderLine* line = *it;
-      line->key.trim();
       if (line->key.equalsIgnoreCase(key)) {
         const char* result = line->value.c_str();
         return line->active ? result : nullptr;
@@ -206,9 +207,11 @@ class HttpHeader {
     out.print(msg);
 
     // remove crlf from log
-    int len = strnlen(msg, 200);
-    msg[len - 2] = 0;
-    DlnaLogger.log(DlnaInfo, "writeHeaderLine -> %s", msg);
+    if (DlnaLogger.isLogging(DlnaInfo)) {
+      int len = strnlen(msg, 200);
+      msg[len - 2] = 0;
+      DlnaLogger.log(DlnaInfo, "writeHeaderLine -> %s", msg);
+    }
 
     // marke as processed
     header->active = false;
@@ -326,6 +329,8 @@ class HttpHeader {
                        "HttpHeader::headerLine - new line created for %s", key);
         newLine->active = true;
         newLine->key = key;
+        // trim only once: the key is compared on each lookup
+        newLine->key.trim();
         lines.push_back(newLine);
         return newLine;
       }
@@ -121,6 +121,8 @@ class HttpRequest {
     this->connection = connection;
   }
 
+  const char *getConnection() { return connection; }
+
   virtual void setAcceptsEncoding(const char *enc) {
     this->accept_encoding = enc;
   }
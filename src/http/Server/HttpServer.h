@@ -11,6 +11,7 @@
 #include "HttpRequestRewrite.h"
 #include "HttpTunnel.h"
 #include "Server.h"
+#include "basic/IPAddressAndPort.h"
 #include "basic/List.h"
 
 namespace tiny_dlna {
@@ -238,16 +239,21 @@ class HttpServer {
     bool result = false;
     // check in registered handlers
     StrView pathStr = StrView(path);
+    // request values which are the same for all handlers
+    TinyMethodID method = request_header.method();
+    const char* accept = request_header.accept();
+    bool is_logging = DlnaLogger.isLogging(DlnaInfo);
     for (auto handler_line_ptr : handler_collection) {
-      DlnaLogger.log(DlnaInfo, "onRequest: %s vs: %s %s %s",
-                     path,
-                     nullstr(handler_line_ptr->path.c_str()),
-                     methods[handler_line_ptr->method],
-                     nullstr(handler_line_ptr->mime));
-
-      if (pathStr.matches(handler_line_ptr->path.c_str()) &&
-          request_header.method() == handler_line_ptr->method &&
-          matchesMime(handler_line_ptr->mime, request_header.accept())) {
+      if (is_logging) {
+        DlnaLogger.log(DlnaInfo, "onRequest: %s vs: %s %s %s", path,
+                       nullstr(handler_line_ptr->path.c_str()),
+                       methods[handler_line_ptr->method],
+                       nullstr(handler_line_ptr->mime));
+      }
+
+      if (method == handler_line_ptr->method &&
+          pathStr.matches(handler_line_ptr->path.c_str()) &&
+          matchesMime(handler_line_ptr->mime, accept)) {
         // call registed handler function
         DlnaLogger.log(DlnaInfo, "onRequest %s", "->found",
                        nullstr(handler_line_ptr->path.c_str()));
@@ -282,22 +288,15 @@ class HttpServer {
   void replyChunked(const char* contentType, int status = 200,
                     const char* msg = SUCCESS) {
     DlnaLogger.log(DlnaInfo, "reply %s", "replyChunked");
-    reply_header.setValues(status, msg);
     reply_header.put(TRANSFER_ENCODING, CHUNKED);
-    reply_header.put(CONTENT_TYPE, contentType);
-    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
-    reply_header.write(this->client());
+    writeReplyHeader(contentType, -1, status, msg);
   }
 
   /// write reply - copies data from input stream with header size
   void reply(const char* contentType, Stream& inputStream, int size,
              int status = 200, const char* msg = SUCCESS) {
     DlnaLogger.log(DlnaInfo, "reply %s", "stream");
-    reply_header.setValues(status, msg);
-    reply_header.put(CONTENT_LENGTH, size);
-    reply_header.put(CONTENT_TYPE, contentType);
-    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
-    reply_header.write(this->client());
+    writeReplyHeader(contentType, size, status, msg);
 
     while (inputStream.available()) {
       int len = inputStream.readBytes(buffer.data(), buffer.size());
@@ -311,10 +310,7 @@ class HttpServer {
   void reply(const char* contentType, void (*callback)(Stream& out),
              int status = 200, const char* msg = SUCCESS) {
     DlnaLogger.log(DlnaInfo, "reply %s", "callback");
-    reply_header.setValues(status, msg);
-    reply_header.put(CONTENT_TYPE, contentType);
-    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
-    reply_header.write(this->client());
+    writeReplyHeader(contentType, -1, status, msg);
     callback(*client_ptr);
     // inputStream.close();
     endClient();
@@ -324,10 +320,7 @@ class HttpServer {
   void reply(const char* contentType, void (*callback)(Print& out),
              int status = 200, const char* msg = SUCCESS) {
     DlnaLogger.log(DlnaInfo, "reply %s", "callback");
-    reply_header.setValues(status, msg);
-    reply_header.put(CONTENT_TYPE, contentType);
-    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
-    reply_header.write(this->client());
+    writeReplyHeader(contentType, -1, status, msg);
     callback(*client_ptr);
     // inputStream.close();
     endClient();
@@ -338,11 +331,7 @@ class HttpServer {
              const char* msg = SUCCESS) {
     DlnaLogger.log(DlnaInfo, "reply %s", "str");
     int len = strlen(str);
-    reply_header.setValues(status, msg);
-    reply_header.put(CONTENT_LENGTH, len);
-    reply_header.put(CONTENT_TYPE, contentType);
-    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
-    reply_header.write(this->client());
+    writeReplyHeader(contentType, len, status, msg);
     client_ptr->write((const uint8_t*)str, len);
     endClient();
   }
@@ -350,11 +339,7 @@ class HttpServer {
   void reply(const char* contentType, const uint8_t* str, int len,
              int status = 200, const char* msg = SUCCESS) {
     DlnaLogger.log(DlnaInfo, "reply %s", "str");
-    reply_header.setValues(status, msg);
-    reply_header.put(CONTENT_LENGTH, len);
-    reply_header.put(CONTENT_TYPE, contentType);
-    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
-    reply_header.write(this->client());
+    writeReplyHeader(contentType, len, status, msg);
     client_ptr->write((const uint8_t*)str, len);
     endClient();
   }
@@ -465,6 +450,18 @@ class HttpServer {
   /// Converts null to an empty string
   const char* nullstr(const char* in) { return in == nullptr ? "" : in; }
 
+  /// writes the reply header: the Content-Length is omitted if size < 0
+  void writeReplyHeader(const char* contentType, int size, int status,
+                        const char* msg) {
+    reply_header.setValues(status, msg);
+    if (size >= 0) {
+      reply_header.put(CONTENT_LENGTH, size);
+    }
+    reply_header.put(CONTENT_TYPE, contentType);
+    reply_header.put(CONNECTION, CON_KEEP_ALIVE);
+    reply_header.write(this->client());
+  }
+
   // process a full request and send the reply
   void processRequest() {
     DlnaLogger.log(DlnaInfo, "processRequest");